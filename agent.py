@@ -1,7 +1,13 @@
+import concurrent.futures
+import functools
+import importlib
+import importlib.metadata
 import os
 import platform
-import subprocess
+import resource
+import stat
 import sys
+import threading
 import asyncio
 from datetime import datetime
 from pathlib import Path
@@ -9,10 +15,8 @@ from typing import Awaitable, Callable
 
 import tomllib
 from livekit import rtc
-from google.genai import types as genai_types
 from livekit.agents import Agent, AgentSession, function_tool, get_job_context
 from livekit.agents.llm import ImageContent
-from livekit.plugins import google, silero
 
 ROOT = Path(__file__).resolve().parent
 DEFAULTS_PATH = ROOT / "config" / "defaults.toml"
@@ -31,8 +35,7 @@ def print(*args, **kwargs):  # type: ignore[no-redef]
 
 def _load_agent_defaults() -> dict[str, object]:
     try:
-        with DEFAULTS_PATH.open("rb") as f:
-            payload = tomllib.load(f)
+        payload = tomllib.loads(DEFAULTS_PATH.read_bytes().decode("utf-8"))
     except FileNotFoundError as exc:
         raise RuntimeError(
             f"Missing defaults file: {DEFAULTS_PATH}. "
@@ -109,7 +112,10 @@ STT_USE_STREAMING = _bool_setting("STT_USE_STREAMING")
 MIN_ENDPOINTING_DELAY = _required_float_setting("MIN_ENDPOINTING_DELAY")
 MAX_ENDPOINTING_DELAY = _required_float_setting("MAX_ENDPOINTING_DELAY")
 MAX_TOOL_OUTPUT_CHARS = 4000
-PYTHON_TOOL_TIMEOUT_SECONDS = 10
+PYTHON_TOOL_TIMEOUT_SECONDS = 30
+PYTHON_TOOL_CPU_SECONDS = 15
+PYTHON_TOOL_MAX_MEMORY_BYTES = 512 * 1024 * 1024
+PYTHON_TOOL_MAX_OPEN_FILES = 128
 MAX_SEND_FILE_BYTES = 25 * 1024 * 1024
 USER_SYSTEM_INSTRUCTIONS_PATH = Path("user/system/instructions.md")
 DEFAULT_USER_SYSTEM_INSTRUCTIONS = """This file is loaded into the agent system instructions at startup.
@@ -127,11 +133,24 @@ ENGLISH_STT_FALLBACK = "en-US"
 
 
 def _read_pyproject(pyproject_path: Path) -> tuple[str, str, str, int]:
-    if not pyproject_path.exists():
-        return ("unknown", "unknown", "unknown", 0)
+    try:
+        distribution = importlib.metadata.metadata("glosos")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    else:
+        dependencies = importlib.metadata.requires("glosos") or []
+        return (
+            distribution.get("Name", "unknown"),
+            distribution.get("Version", "unknown"),
+            distribution.get("Requires-Python", "unknown"),
+            len(dependencies),
+        )
 
-    with pyproject_path.open("rb") as f:
-        pyproject = tomllib.load(f)
+    # Dev checkout without an installed distribution: parse pyproject.toml.
+    try:
+        pyproject = tomllib.loads(pyproject_path.read_bytes().decode("utf-8"))
+    except FileNotFoundError:
+        return ("unknown", "unknown", "unknown", 0)
 
     project = pyproject.get("project", {})
     name = project.get("name", "unknown")
@@ -142,7 +161,10 @@ def _read_pyproject(pyproject_path: Path) -> tuple[str, str, str, int]:
 
 
 def _list_user_files(user_root: Path) -> list[str]:
-    if not user_root.exists() or not user_root.is_dir():
+    try:
+        if not stat.S_ISDIR(os.stat(user_root).st_mode):
+            return []
+    except OSError:
         return []
 
     files: list[str] = []
@@ -154,7 +176,8 @@ def _list_user_files(user_root: Path) -> list[str]:
     return files
 
 
-def _build_project_context() -> str:
+@functools.cache
+def _project_context_lines() -> tuple[str, ...]:
     key_files = (
         "README.md",
         "agent.py",
@@ -163,11 +186,29 @@ def _build_project_context() -> str:
         "config/.env.example",
         "config/defaults.toml",
     )
-    name, version, requires_python, dependency_count = _read_pyproject(ROOT / "pyproject.toml")
-    existing_files = [file_name for file_name in key_files if (ROOT / file_name).exists()]
-    missing_files = [file_name for file_name in key_files if not (ROOT / file_name).exists()]
     user_root = ROOT / "user"
-    user_files = _list_user_files(user_root)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        pyproject_future = pool.submit(_read_pyproject, ROOT / "pyproject.toml")
+        user_files_future = pool.submit(_list_user_files, user_root)
+
+        present: set[str] = set()
+        for rel_dir in sorted({file_name.rpartition("/")[0] for file_name in key_files}):
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            try:
+                with os.scandir(ROOT / rel_dir if rel_dir else ROOT) as entries:
+                    present.update(prefix + entry.name for entry in entries)
+            except OSError:
+                continue
+        existing_files = [file_name for file_name in key_files if file_name in present]
+        missing_files = [file_name for file_name in key_files if file_name not in present]
+
+        name, version, requires_python, dependency_count = pyproject_future.result()
+        user_files = user_files_future.result()
+    try:
+        os.stat(user_root)
+        user_root_exists = True
+    except OSError:
+        user_root_exists = False
     now_local = datetime.now().astimezone()
 
     context_lines = [
@@ -184,7 +225,7 @@ def _build_project_context() -> str:
         "- llm-provider: vertex-ai-service-account",
         f"- key-files-present: {', '.join(existing_files) if existing_files else 'none'}",
         f"- key-files-missing: {', '.join(missing_files) if missing_files else 'none'}",
-        f"- user-root: {user_root if user_root.exists() else f'{user_root} (missing)'}",
+        f"- user-root: {user_root if user_root_exists else f'{user_root} (missing)'}",
         f"- user-files-count: {len(user_files)}",
     ]
     if user_files:
@@ -193,7 +234,14 @@ def _build_project_context() -> str:
     else:
         context_lines.append("- user-files: none")
 
-    return "\n".join(context_lines)
+    return tuple(context_lines)
+
+
+def _build_project_context() -> str:
+    return "\n".join(_project_context_lines())
+
+
+PROJECT_CONTEXT = _build_project_context()
 
 
 def _read_user_system_instructions(root: Path) -> str:
@@ -214,15 +262,19 @@ def _read_user_system_instructions(root: Path) -> str:
 
 
 def _print_project_inspection() -> None:
-    project_context = _build_project_context()
-
-    print("\n[startup] project inspection")
-    print(f"[startup] root: {ROOT}")
-    print(f"[startup] python: {sys.version.split()[0]} ({platform.python_implementation()})")
-    for line in project_context.splitlines()[1:]:
-        print(f"[startup] {line[2:] if line.startswith('- ') else line}")
+    lines = [
+        "\n[startup] project inspection",
+        f"[startup] root: {ROOT}",
+        f"[startup] python: {sys.version.split()[0]} ({platform.python_implementation()})",
+    ]
+    lines.extend(
+        f"[startup] {line[2:] if line.startswith('- ') else line}"
+        for line in _project_context_lines()[1:]
+    )
+    print("\n".join(lines))
 
 
+@functools.cache
 def _google_credentials_file() -> str:
     configured = Path(GOOGLE_CREDENTIALS_FILE).expanduser()
     if not configured.is_absolute():
@@ -242,7 +294,33 @@ def _google_credentials_file() -> str:
     return str(path)
 
 
-def _build_google_llm() -> google.LLM:
+def warm_up_plugins() -> None:
+    """Import the heavy plugin modules ahead of the first session."""
+    importlib.import_module("google.genai.types")
+    importlib.import_module("livekit.plugins.google")
+    importlib.import_module("livekit.plugins.silero")
+    _get_vad()
+
+
+_vad_instance: object | None = None
+_vad_lock = threading.Lock()
+
+
+def _get_vad() -> "silero.VAD":
+    """Load the Silero VAD once and share it across sessions."""
+    global _vad_instance
+    with _vad_lock:
+        if _vad_instance is None:
+            from livekit.plugins import silero
+
+            _vad_instance = silero.VAD.load()
+    return _vad_instance
+
+
+def _build_google_llm() -> "google.LLM":
+    from google.genai import types as genai_types
+    from livekit.plugins import google
+
     resolved_llm_model = {
         "gemini-3-flash": "gemini-3-flash-preview",
     }.get(LLM_MODEL, LLM_MODEL)
@@ -253,7 +331,7 @@ def _build_google_llm() -> google.LLM:
 
     thinking_config = genai_types.ThinkingConfig(
         thinking_level=genai_types.ThinkingLevel.LOW,
-        include_thoughts=False,
+        include_thoughts=_env_setting("GLOSOS_DEBUG_THOUGHTS") == "1",
     )
     llm_kwargs = {
         "model": resolved_llm_model,
@@ -268,8 +346,12 @@ def _build_google_llm() -> google.LLM:
     )
 
 
+def _env_setting(name: str) -> str:
+    return (os.environ.get(name) or "").strip()
+
+
 def _resolved_tts_voice_name() -> str:
-    agent_gender = (os.getenv("AGENT_GENDER") or "").strip().lower()
+    agent_gender = _env_setting("AGENT_GENDER").lower()
     if agent_gender == "male":
         return MALE_TTS_VOICE_NAME
     if agent_gender == "female":
@@ -278,7 +360,7 @@ def _resolved_tts_voice_name() -> str:
 
 
 def _resolved_stt_languages() -> str | list[str]:
-    agent_language = (os.getenv("AGENT_LANGUAGE") or "").strip().lower()
+    agent_language = _env_setting("AGENT_LANGUAGE").lower()
     primary_language = STT_LANGUAGE_BY_AGENT_LANGUAGE.get(agent_language, STT_LANGUAGE)
     if primary_language.lower() == ENGLISH_STT_FALLBACK.lower():
         return primary_language
@@ -286,11 +368,11 @@ def _resolved_stt_languages() -> str | list[str]:
 
 
 def _resolved_agent_name() -> str:
-    return (os.getenv("AGENT_NAME") or "").strip()
+    return _env_setting("AGENT_NAME")
 
 
 def _resolved_agent_gender() -> str:
-    return (os.getenv("AGENT_GENDER") or "").strip().lower()
+    return _env_setting("AGENT_GENDER").lower()
 
 
 def _agent_identity_system_prompt() -> str:
@@ -300,6 +382,8 @@ def _agent_identity_system_prompt() -> str:
 
 
 def build_agent_session() -> AgentSession:
+    from livekit.plugins import google
+
     google_credentials_file = _google_credentials_file()
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = google_credentials_file
     tts_voice_name = _resolved_tts_voice_name()
@@ -322,7 +406,7 @@ def build_agent_session() -> AgentSession:
             use_streaming=True,
             credentials_file=google_credentials_file,
         ),
-        vad=silero.VAD.load(),
+        vad=_get_vad(),
         turn_detection="vad",
         min_endpointing_delay=MIN_ENDPOINTING_DELAY,
         max_endpointing_delay=MAX_ENDPOINTING_DELAY,
@@ -330,10 +414,50 @@ def build_agent_session() -> AgentSession:
     )
 
 
+def _limit_python_tool_resources() -> None:
+    """Cap CPU, memory, and open files in execute_python children (runs post-fork)."""
+    resource.setrlimit(
+        resource.RLIMIT_CPU, (PYTHON_TOOL_CPU_SECONDS, PYTHON_TOOL_CPU_SECONDS)
+    )
+    resource.setrlimit(
+        resource.RLIMIT_AS, (PYTHON_TOOL_MAX_MEMORY_BYTES, PYTHON_TOOL_MAX_MEMORY_BYTES)
+    )
+    resource.setrlimit(
+        resource.RLIMIT_NOFILE, (PYTHON_TOOL_MAX_OPEN_FILES, PYTHON_TOOL_MAX_OPEN_FILES)
+    )
+
+
 FileSendFn = Callable[[Path, str, list[str]], Awaitable[str]]
 DEFAULT_INCOMING_FILES_TOPIC = "lk.chat"
 DEFAULT_INCOMING_FILES_DIR = ROOT / "user" / "incoming"
 
+_INSTRUCTIONS_PREAMBLE = """You are a helpful voice AI assistant.
+            """
+_INSTRUCTIONS_BODY = """
+            You eagerly assist users with their questions by providing information from your extensive knowledge.
+            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
+            You can execute Python in your own project using the execute_python tool. Use python to read files, inspect the environment, perform calculations, making network requests.
+            The environment includes file/data libraries: pypdf, pdfplumber, pandas, matplotlib, openpyxl, xlsxwriter, orjson, ruamel.yaml, Pillow, python-docx, python-pptx, reportlab.
+            For web browsing and extraction, the environment includes: httpx, beautifulsoup4, lxml, trafilatura, feedparser, duckduckgo-search.
+            Prefer these libraries for file creation/manipulation and web research tasks before suggesting extra installs.
+            You can create and manage recurring background tasks by writing Python scripts to app/user/system/scripts which are executed every 60 seconds by script_scheduler.py.
+            You can send files to the user using the send_file_to_user tool.
+            All text files created should be in .md format unless another format is specified.
+            If you need to log some data like meal calories or weight tracking, create or update .json files in the /app/user directory.
+            Api keys are stored in user/system/keys.md.
+            Store all user data files and tracking files in the /app/user directory. You have read/write access to this directory and its subdirectories.
+            When a user sends a file, it is stored in /app/user/incoming.
+            When users ask about your behavior, capabilities, dependencies, setup, or files, ground your answers in this context:
+
+
+            """
+_INSTRUCTIONS_EPILOGUE = """
+
+            If you need to preserve important information across restarts, update app/user/system/instructions.md with concise, durable notes only.
+
+            """
+_CONTEXT_INSTRUCTIONS = _INSTRUCTIONS_BODY + PROJECT_CONTEXT + _INSTRUCTIONS_EPILOGUE
+
 
 def _stream_info_value(info: object, key: str) -> str:
     if hasattr(info, key):
@@ -401,43 +525,22 @@ class Assistant(Agent):
         send_file_fn: FileSendFn | None = None,
         room: rtc.Room | None = None,
     ) -> None:
-        root = Path(__file__).resolve().parent
-        self._root = root
+        self._root = ROOT
         self._send_file_fn = send_file_fn
         self._room = room
         self._latest_frame: object | None = None
         self._video_stream: rtc.VideoStream | None = None
         self._video_tasks: set[asyncio.Task[None]] = set()
-        user_system_instructions = _read_user_system_instructions(root)
+        user_system_instructions = _read_user_system_instructions(ROOT)
         identity_system_prompt = _agent_identity_system_prompt()
+        if project_context is PROJECT_CONTEXT:
+            context_block = _CONTEXT_INSTRUCTIONS
+        else:
+            context_block = _INSTRUCTIONS_BODY + project_context + _INSTRUCTIONS_EPILOGUE
         super().__init__(
-            instructions="""You are a helpful voice AI assistant.
-            """
+            instructions=_INSTRUCTIONS_PREAMBLE
             + identity_system_prompt
-            + """
-            You eagerly assist users with their questions by providing information from your extensive knowledge.
-            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
-            You can execute Python in your own project using the execute_python tool. Use python to read files, inspect the environment, perform calculations, making network requests.
-            The environment includes file/data libraries: pypdf, pdfplumber, pandas, matplotlib, openpyxl, xlsxwriter, orjson, ruamel.yaml, Pillow, python-docx, python-pptx, reportlab.
-            For web browsing and extraction, the environment includes: httpx, beautifulsoup4, lxml, trafilatura, feedparser, duckduckgo-search.
-            Prefer these libraries for file creation/manipulation and web research tasks before suggesting extra installs.
-            You can create and manage recurring background tasks by writing Python scripts to app/user/system/scripts which are executed every 60 seconds by script_scheduler.py.
-            You can send files to the user using the send_file_to_user tool.
-            All text files created should be in .md format unless another format is specified.
-            If you need to log some data like meal calories or weight tracking, create or update .json files in the /app/user directory.
-            Api keys are stored in user/system/keys.md.
-            Store all user data files and tracking files in the /app/user directory. You have read/write access to this directory and its subdirectories.
-            When a user sends a file, it is stored in /app/user/incoming.
-            When users ask about your behavior, capabilities, dependencies, setup, or files, ground your answers in this context:
-
-
-            """
-            + project_context
-            + """
-
-            If you need to preserve important information across restarts, update app/user/system/instructions.md with concise, durable notes only.
-
-            """
+            + context_block
             + user_system_instructions,
         )
 
@@ -495,28 +598,54 @@ class Assistant(Agent):
     @function_tool
     async def execute_python(self, code: str) -> str:
         """Execute Python code in the project environment and return stdout/stderr and exit code."""
-        project_root = Path(__file__).resolve().parent
-
-        def _run() -> subprocess.CompletedProcess[str]:
-            return subprocess.run(
-                [sys.executable, "-c", code],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=PYTHON_TOOL_TIMEOUT_SECONDS,
-                check=False,
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                code,
+                cwd=ROOT,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                preexec_fn=_limit_python_tool_resources,
             )
+        except Exception as exc:
+            return f"execution error: {exc.__class__.__name__}: {exc}"
+
+        async def _read_capped(stream: asyncio.StreamReader) -> bytes:
+            buf = bytearray()
+            while len(buf) <= MAX_TOOL_OUTPUT_CHARS:
+                chunk = await stream.read(MAX_TOOL_OUTPUT_CHARS + 1 - len(buf))
+                if not chunk:
+                    return bytes(buf)
+                buf.extend(chunk)
+            # Output cap reached: stop the child instead of buffering the rest.
+            proc.kill()
+            return bytes(buf)
+
+        async def _collect() -> tuple[bytes, bytes]:
+            stdout_bytes, stderr_bytes = await asyncio.gather(
+                _read_capped(proc.stdout),
+                _read_capped(proc.stderr),
+            )
+            await proc.wait()
+            return stdout_bytes, stderr_bytes
 
         try:
-            result = await asyncio.to_thread(_run)
-        except subprocess.TimeoutExpired:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                _collect(), timeout=PYTHON_TOOL_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
             return f"timed out after {PYTHON_TOOL_TIMEOUT_SECONDS}s"
         except Exception as exc:
+            proc.kill()
+            await proc.wait()
             return f"execution error: {exc.__class__.__name__}: {exc}"
 
-        stdout = (result.stdout or "").strip()
-        stderr = (result.stderr or "").strip()
-        combined = f"exit_code={result.returncode}\nstdout:\n{stdout or '<empty>'}\nstderr:\n{stderr or '<empty>'}"
+        stdout = stdout_bytes[:MAX_TOOL_OUTPUT_CHARS].decode("utf-8", errors="replace").strip()
+        stderr = stderr_bytes[:MAX_TOOL_OUTPUT_CHARS].decode("utf-8", errors="replace").strip()
+        combined = f"exit_code={proc.returncode}\nstdout:\n{stdout or '<empty>'}\nstderr:\n{stderr or '<empty>'}"
         if len(combined) > MAX_TOOL_OUTPUT_CHARS:
             combined = combined[:MAX_TOOL_OUTPUT_CHARS] + "\n...<truncated>"
         return combined
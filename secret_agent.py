@@ -1,4 +1,5 @@
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -9,30 +10,35 @@ from script_scheduler import start_script_scheduler
 from agent import (
     Assistant,
     LIVEKIT_URL,
-    _build_project_context,
+    PROJECT_CONTEXT,
     _print_project_inspection,
     build_agent_session,
     register_incoming_file_handler,
+    warm_up_plugins,
 )
 
 load_dotenv("config/.env")
 
 
+REQUIRED_ENV_KEYS = ("LIVEKIT_API_KEY", "LIVEKIT_API_SECRET")
+
+
 def _configure_livekit_auth() -> None:
-    livekit_secret = (os.getenv("LIVEKIT_API_SECRET") or "").strip()
-    if not livekit_secret:
+    env = os.environ
+    missing = [key for key in REQUIRED_ENV_KEYS if not (env.get(key) or "").strip()]
+    if missing:
         raise RuntimeError(
-            "Missing required secret: LIVEKIT_API_SECRET. "
+            f"Missing required secret(s): {', '.join(missing)}. "
             "Worker mode requires project API credentials."
         )
 
 
 server = AgentServer(ws_url=LIVEKIT_URL)
+threading.Thread(target=warm_up_plugins, name="plugin-warm-up", daemon=True).start()
 
 
 @server.rtc_session()
 async def my_agent(ctx: agents.JobContext) -> None:
-    project_context = _build_project_context()
     session = build_agent_session()
     register_incoming_file_handler(ctx.room)
     
@@ -46,7 +52,7 @@ async def my_agent(ctx: agents.JobContext) -> None:
 
     await session.start(
         room=ctx.room,
-        agent=Assistant(project_context=project_context, send_file_fn=_send_file),
+        agent=Assistant(project_context=PROJECT_CONTEXT, send_file_fn=_send_file),
     )
 
     await session.generate_reply(
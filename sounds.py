@@ -4,37 +4,49 @@ import sys
 
 from livekit import rtc
 
+READY_TONE_SAMPLE_RATE = 48000
+READY_TONE_NUM_CHANNELS = 1
+READY_TONE_FREQUENCY_HZ = 400.0
+READY_TONE_DURATION_SECONDS = 0.3
+READY_TONE_AMPLITUDE = 0.35
+READY_TONE_SAMPLES_PER_CHUNK = 960  # 20ms at 48kHz
+
+
+def _render_ready_tone_chunks() -> tuple[bytes, ...]:
+    total_samples = int(READY_TONE_SAMPLE_RATE * READY_TONE_DURATION_SECONDS)
+    two_pi_f = 2.0 * math.pi * READY_TONE_FREQUENCY_HZ
+
+    chunks: list[bytes] = []
+    for offset in range(0, total_samples, READY_TONE_SAMPLES_PER_CHUNK):
+        sample_count = min(READY_TONE_SAMPLES_PER_CHUNK, total_samples - offset)
+        pcm = bytearray()
+        for index in range(sample_count):
+            t = (offset + index) / READY_TONE_SAMPLE_RATE
+            sample = int(32767 * READY_TONE_AMPLITUDE * math.sin(two_pi_f * t))
+            pcm.extend(sample.to_bytes(2, byteorder="little", signed=True))
+        chunks.append(bytes(pcm))
+    return tuple(chunks)
+
+
+READY_TONE_CHUNKS = _render_ready_tone_chunks()
+
 
 async def emit_ready_sound(room: rtc.Room) -> None:
-    sample_rate = 48000
-    num_channels = 1
-    frequency_hz = 400.0
-    duration_seconds = 0.3
-    amplitude = 0.35
-    samples_per_chunk = 960  # 20ms at 48kHz
-
-    source = rtc.AudioSource(sample_rate=sample_rate, num_channels=num_channels)
+    source = rtc.AudioSource(
+        sample_rate=READY_TONE_SAMPLE_RATE,
+        num_channels=READY_TONE_NUM_CHANNELS,
+    )
     track = rtc.LocalAudioTrack.create_audio_track("ready-tone", source)
     publication = None
 
     try:
         publication = await room.local_participant.publish_track(track)
-        total_samples = int(sample_rate * duration_seconds)
-        two_pi_f = 2.0 * math.pi * frequency_hz
-
-        for offset in range(0, total_samples, samples_per_chunk):
-            sample_count = min(samples_per_chunk, total_samples - offset)
-            pcm = bytearray()
-            for index in range(sample_count):
-                t = (offset + index) / sample_rate
-                sample = int(32767 * amplitude * math.sin(two_pi_f * t))
-                pcm.extend(sample.to_bytes(2, byteorder="little", signed=True))
-
+        for pcm in READY_TONE_CHUNKS:
             frame = rtc.AudioFrame(
-                data=bytes(pcm),
-                sample_rate=sample_rate,
-                num_channels=num_channels,
-                samples_per_channel=sample_count,
+                data=pcm,
+                sample_rate=READY_TONE_SAMPLE_RATE,
+                num_channels=READY_TONE_NUM_CHANNELS,
+                samples_per_channel=len(pcm) // 2,
             )
             await source.capture_frame(frame)
 
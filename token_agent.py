@@ -13,7 +13,7 @@ from livekit.agents.voice import room_io
 from agent import (
     Assistant,
     LIVEKIT_URL,
-    _build_project_context,
+    PROJECT_CONTEXT,
     _print_project_inspection,
     build_agent_session,
     register_incoming_file_handler,
@@ -108,7 +108,6 @@ async def _run_token_session(
     stop_event: asyncio.Event | None,
 ) -> None:
     _apply_agent_env(agent_env)
-    project_context = _build_project_context()
 
     room = rtc.Room()
     disconnected = asyncio.Event()
@@ -252,7 +251,7 @@ async def _run_token_session(
 
         await session.start(
             room=room,
-            agent=Assistant(project_context=project_context, send_file_fn=_send_file, room=room),
+            agent=Assistant(project_context=PROJECT_CONTEXT, send_file_fn=_send_file, room=room),
             room_options=room_options,
         )
         _schedule_state_publish("listening")